@@ -186,6 +186,8 @@ def _wrap_for_local(
     data_dir: Path | None,
     store: Store | None,
 ) -> Callable[..., R]:
+    ordered_hooks = tuple(reversed(hooks))
+
     def run_one(index: int, *args) -> R:
         dir_ctx = data_dir_context(path=data_dir) if data_dir is not None else nullcontext()
         store_ctx = store_context(store) if store is not None else nullcontext()
@@ -194,7 +196,7 @@ def _wrap_for_local(
             dir_ctx,
             store_ctx,
         ):
-            for hook in reversed(hooks):
+            for hook in ordered_hooks:
                 hook()
             result = fn(*args, **kwargs)
             return result
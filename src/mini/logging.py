@@ -2,6 +2,7 @@ import logging
 import sys
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal, TypeAlias, override
 
 TRACE = 5
@@ -31,13 +32,19 @@ class ConciseFormatter(logging.Formatter):
     def format(self, record):
         elapsed = time.monotonic() - self.start_time
         abbreviated_log_level = record.levelname[0]
-        abbreviated_module_name = ".".join(p[:2] for p in record.name.split("."))
+        abbreviated_module_name = _abbreviate(record.name)
 
         # Format the message
         prefix = f"{abbreviated_log_level} {elapsed:.1f} {abbreviated_module_name}:"
         return f"{prefix:15s}{record.getMessage()}"
 
 
+@lru_cache(maxsize=256)
+def _abbreviate(name: str) -> str:
+    """Shorten a dotted logger name; loggers are few and long-lived, so each is computed once."""
+    return ".".join(p[:2] for p in name.split("."))
+
+
 NamedFd: TypeAlias = Literal["stdout", "stderr"]
 
 
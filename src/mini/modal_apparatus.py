@@ -822,6 +822,8 @@ def _wrap_for_modal(
     data_dir: Path | None,
     commit_volume: modal.Volume | None = None,
 ) -> Callable[..., R]:
+    ordered_hooks = tuple(reversed(hooks))
+
     @wraps(fn)
     def wrapped_fn(index: int, *args) -> R:
         # Signal that this container started successfully. Emitted directly
@@ -849,7 +851,7 @@ def _wrap_for_modal(
             dir_ctx,
             store_ctx,
         ):
-            for hook in reversed(hooks):
+            for hook in ordered_hooks:
                 hook()
             result = fn(*args, **kwargs)
             if commit_volume is not None:
@@ -13,7 +13,7 @@ from mini.urns import matches_urn, parse_urn, to_urn
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressMessage:
     """Structured progress update from a job."""
 
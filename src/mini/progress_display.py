@@ -183,14 +183,18 @@ class RichProgressDisplay:
         assert self.progress is not None
         job_id = msg.job_id
 
-        if job_id not in self.jobs:
+        state = self.jobs.get(job_id)
+        if state is None:
             task_id = self.progress.add_task(
                 f"[cyan]Job {job_id}[/]",
                 total=msg.total if msg.total > 0 else None,
             )
-            self.jobs[job_id] = JobState(task_id=task_id, total=msg.total)
+            state = self.jobs[job_id] = JobState(task_id=task_id, total=msg.total)
+        elif state.step == msg.step and state.message == msg.message and msg.total in (0, state.total):
+            # Nothing visible changed (e.g. a metrics-only re-emit): skip the redraw,
+            # and don't count a repeated final step as a second completion.
+            return
 
-        state = self.jobs[job_id]
         state.step = msg.step
         state.message = msg.message
         if msg.total > 0 and state.total != msg.total:
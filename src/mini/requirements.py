@@ -9,6 +9,16 @@ import modal
 
 log = logging.getLogger(__name__)
 
+# Extracts package name, optional extras, and version from lines like "package v1.2.3"
+# and "package[extra] v1.2.3", with or without tree characters. The lazy prefix
+# anchored at each line start keeps only the first match per line, so the whole
+# output can be scanned in one pass.
+# https://packaging.python.org/en/latest/specifications/name-normalization/#name-format
+_PKG_RE = re.compile(
+    r"^.*?([A-Z0-9]|[A-Z0-9][A-Z0-9._-]*[A-Z0-9])(\[[A-Z0-9._,-]+\])? v(\S+)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
 
 def uv_freeze(
     *packages: str,
@@ -32,9 +42,6 @@ def uv_freeze(
 
     cmd = ["uv", "--offline", "tree"]
 
-    result = subprocess.run(cmd + ["--no-dedupe", "--all-groups"], text=True, capture_output=True, check=True)
-    all_deps = parse_uv_tree_output(result.stdout, ignore_first=True)
-
     opts: list[str | tuple[str, ...]] = []
     opts += [("--package", pkg) for pkg in packages]
     opts += [("--group", g) for g in (groups or [])]
@@ -52,39 +59,40 @@ def uv_freeze(
     opts = [(opt,) if isinstance(opt, str) else opt for opt in opts]
     flat_opts = [opt for sublist in opts for opt in sublist]
 
-    result = subprocess.run(cmd + flat_opts, text=True, capture_output=True, check=True)
-    selected_deps = parse_uv_tree_output(result.stdout, ignore_first=True)
+    # The two trees are independent, so run both uv processes at once.
+    with _popen(cmd + ["--no-dedupe", "--all-groups"]) as all_proc, _popen(cmd + flat_opts) as selected_proc:
+        all_deps = parse_uv_tree_output(_communicate(all_proc), ignore_first=True)
+        selected_deps = parse_uv_tree_output(_communicate(selected_proc), ignore_first=True)
     log.info(f"Selected {len(selected_deps)} of {len(all_deps)} dependencies")
     log.debug("Dependencies: %s", selected_deps)
     return selected_deps
 
 
+def _popen(args: list[str]) -> subprocess.Popen[str]:
+    return subprocess.Popen(args, text=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+def _communicate(proc: subprocess.Popen[str]) -> str:
+    """Wait for *proc* and return its stdout, raising like `subprocess.run(..., check=True)`."""
+    stdout, stderr = proc.communicate()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args, stdout, stderr)
+    return stdout
+
+
 def parse_uv_tree_output(output: str, ignore_first: bool) -> list[str]:
     """Parse the output of 'uv tree' command to extract package specifications."""
-    requirements: set[str] = set()
-
-    lines = output.strip().split("\n")
+    buf = output.strip()
     if ignore_first:
-        lines = lines[1:]
-
-    # Regular expression to extract package name, optional extras, and version.
-    # Matches lines like "package v1.2.3" and "package[extra] v1.2.3", with or
-    # without tree characters.
-    # https://packaging.python.org/en/latest/specifications/name-normalization/#name-format
-    name_pattern = r"([A-Z0-9]|[A-Z0-9][A-Z0-9._-]*[A-Z0-9])"
-    extras_pattern = r"(\[[A-Z0-9._,-]+\])?"
-    pattern = name_pattern + extras_pattern + r" v([^\s]+)"
-
-    for line in lines:
-        match = re.search(pattern, line, re.IGNORECASE)
-        if match:
-            pkg_name = match.group(1)
-            extras = match.group(2) or ""
-            version = match.group(3)
-            # Strip local version identifier (e.g., +cpu, +cu121) for cross-platform compatibility
-            # Modal and other environments may not have the same local builds available
-            version = version.split("+")[0]
-            requirements.add(f"{pkg_name}{extras}=={version}")
+        buf = buf.partition("\n")[2]
+
+    requirements: set[str] = set()
+    for match in _PKG_RE.finditer(buf):
+        pkg_name, extras, version = match.groups()
+        # Strip local version identifier (e.g., +cpu, +cu121) for cross-platform compatibility
+        # Modal and other environments may not have the same local builds available
+        version = version.split("+")[0]
+        requirements.add(f"{pkg_name}{extras or ''}=={version}")
 
     return sorted(requirements)
 
@@ -1,6 +1,11 @@
-from itertools import zip_longest
+from functools import lru_cache
+import string
 import urllib.parse
 
+# Characters urllib.parse.quote never escapes; with safe="" everything else is %XX-encoded.
+_ALWAYS_SAFE = string.ascii_letters + string.digits + "_.-~"
+_QUOTE_TABLE = tuple(chr(b) if chr(b) in _ALWAYS_SAFE else f"%{b:02X}" for b in range(256))
+
 
 def matches_urn(urn: str, pattern: str) -> bool:
     """
@@ -8,26 +13,41 @@ def matches_urn(urn: str, pattern: str) -> bool:
 
     The pattern can contain wildcards ('*'); these match anything except a colon.
     """
-    parsed = parse_urn(urn)
-    partspec = pattern.split(":")
-    for part, spec in zip_longest(parsed, partspec):
-        if spec == "*":
+    parts = parse_urn(urn)
+    for i, spec in enumerate(_pattern_parts(pattern)):
+        if spec is None:
             # Allow wildcard
             continue
-        if spec is None:
-            # Pattern is shorter than URN
-            break
-        if part != urllib.parse.unquote(spec):
+        if i >= len(parts) or parts[i] != spec:
             return False
+    # Pattern may be shorter than URN
     return True
 
 
 def to_urn(*parts: str) -> str:
     """Convert a sequence of parts to a colon-separated URN."""
-    return ":".join(urllib.parse.quote(part, safe="") for part in parts)
+    return ":".join(_quote(part) for part in parts)
 
 
 def parse_urn(urn: str) -> tuple[str, ...]:
     """Convert a URN to a tuple of parts."""
     parts = urn.strip().split(":")
-    return tuple(urllib.parse.unquote(part) for part in parts)
+    return tuple(_unquote(part) for part in parts)
+
+
+def _quote(part: str) -> str:
+    """Equivalent to ``urllib.parse.quote(part, safe="")``, minus its per-call setup."""
+    if not part.strip(_ALWAYS_SAFE):
+        # Nothing to escape (the common case: ids, numbers, fixed words)
+        return part
+    return "".join([_QUOTE_TABLE[b] for b in part.encode()])
+
+
+def _unquote(part: str) -> str:
+    return urllib.parse.unquote(part) if "%" in part else part
+
+
+@lru_cache(maxsize=256)
+def _pattern_parts(pattern: str) -> tuple[str | None, ...]:
+    """Split and unquote a pattern once; wildcards become None. Patterns are a small fixed set."""
+    return tuple(None if spec == "*" else _unquote(spec) for spec in pattern.split(":"))
@@ -1,14 +1,30 @@
 import xml.etree.ElementTree as ET
-from math import isnan
+from dataclasses import dataclass
 from typing import Sequence
 
 import numpy as np
 
 from subline.series import Series
-from subline.types import TokenBB
+from subline.types import TokenBB, TokenBBArray
 from utils.dom import Element, id_sequence
 
 
+@dataclass
+class _Knots:
+    """Per-token path geometry for a window plus one token of context on either side."""
+
+    peek: slice
+    inner: slice
+    """The window's own tokens, as indices into the peeked arrays"""
+    x: np.ndarray
+    """Token start positions relative to the window start, plus one trailing end position"""
+    cp1: np.ndarray
+    vertex1: np.ndarray
+    cp2: np.ndarray
+    vertex2: np.ndarray
+    wide: np.ndarray
+
+
 class Sparkline:
     """A multi-series sparkline plot that aligns with text characters."""
 
@@ -23,61 +39,95 @@ class Sparkline:
         self.series.append(Series(values, color, dasharray=dasharray))
         return self
 
+    def _knots(self, spans: Sequence[TokenBB] | TokenBBArray, window: slice) -> _Knots:
+        """Lay out the knots for *window*; they depend only on the spans, so all series share them."""
+        # Expand window to include one token of context on either side
+        peek = slice(max(0, window.start - 1), window.stop + 1, None)
+        peeked = TokenBBArray.of(spans[peek])
+        width, first, last = peeked.widths, peeked.first_chars, peeked.last_chars
+        lead = window.start - peek.start
+        inner = slice(lead, lead + max(0, min(window.stop, len(spans)) - window.start))
+
+        # Start x at -width of the peek token if we have one, so the window itself
+        # starts at 0. cumsum accumulates left to right, so positions match a
+        # running `x += width` exactly.
+        x0 = -width[0] if lead else 0.0
+        x = np.cumsum(np.concatenate(([x0], width)))
+        starts = x[:-1]
+
+        # Each token has up to two knots: one at its first char, and (if wide) one
+        # at its last char, with control points reaching back toward the token edge.
+        vertex1 = starts + first
+        vertex2 = starts + last
+        return _Knots(
+            peek=peek,
+            inner=inner,
+            x=x,
+            cp1=vertex1 - first,
+            vertex1=vertex1,
+            cp2=vertex2 - (width - last),
+            vertex2=vertex2,
+            wide=peeked.is_wide,
+        )
+
     def _create_path_data(
         self,
-        values: Sequence[float],
-        spans: Sequence[TokenBB],
+        values: np.ndarray,
+        spans: Sequence[TokenBB] | TokenBBArray,
         window: slice,
         h: float,
+        knots: _Knots | None = None,
     ) -> str:
         """Create SVG path data for values, breaking at NaN values."""
-        # Expand window to include one token of context on either side
-        peek = slice(max(0, window.start - 1), window.stop + 1, None)
-
-        # Start x at -width of the peek token if we have one
-        x = -(spans[peek.start].width) if peek.start < window.start else 0
+        if knots is None:
+            knots = self._knots(spans, window)
+        cp1, vertex1, cp2, vertex2, wide = knots.cp1, knots.vertex1, knots.cp2, knots.vertex2, knots.wide
+        n = len(vertex1)
+        v = np.asarray(values[knots.peek], dtype=np.float64)
+        if len(v) != n:
+            raise ValueError(f"Got {len(v)} values for {n} spans")
+        if n == 0:
+            return ""
+
+        y = h - h * v
+
+        # Break the path at NaNs: a drawn point that follows a gap starts a new subpath.
+        drawn = ~np.isnan(v)
+        starts = drawn & ~np.concatenate(([False], drawn[:-1]))
 
         points = []
-        is_drawing = False
-
-        for span, v in zip(spans[peek], values[peek], strict=True):
-            first, last = span.first_char, span.last_char
-            cp_dx1 = first
-            cp_dx2 = span.width - last
-            knot1 = (x + first - cp_dx1, x + first)
-            knot2 = (x + last - cp_dx2, x + last)
-
-            if isnan(v):
-                is_drawing = False
+        for start, c1, v1, c2, v2, yy, is_wide in zip(
+            starts[drawn].tolist(),
+            cp1[drawn].tolist(),
+            vertex1[drawn].tolist(),
+            cp2[drawn].tolist(),
+            vertex2[drawn].tolist(),
+            y[drawn].tolist(),
+            wide[drawn].tolist(),
+            strict=True,
+        ):
+            if start:
+                points.append(f"M {v1:.1f},{yy:.1f}")
             else:
-                y = h - h * v
-                cp, vertex = knot1
-                if is_drawing:
-                    points.append(f"S {cp:.1f},{y:.1f} {vertex:.1f},{y:.1f}")
-                else:
-                    points.append(f"M {vertex:.1f},{y:.1f}")
-                    is_drawing = True
-
-                if span.is_wide:
-                    cp, vertex = knot2
-                    points.append(f"S {cp:.1f},{y:.1f} {vertex:.1f},{y:.1f}")
-
-            x += span.width
+                points.append(f"S {c1:.1f},{yy:.1f} {v1:.1f},{yy:.1f}")
+            if is_wide:
+                points.append(f"S {c2:.1f},{yy:.1f} {v2:.1f},{yy:.1f}")
 
         return " ".join(points)
 
     def _render_series(
         self,
         parent: ET.Element,
-        values: Sequence[float],
-        spans: list[TokenBB],
+        values: np.ndarray,
+        spans: Sequence[TokenBB] | TokenBBArray,
         window: slice,
         h: float,
         color: str,
         dasharray: str,
+        knots: _Knots | None = None,
     ):
         """Render a single sparkline series."""
-        path_data = self._create_path_data(values, spans, window, h)
+        path_data = self._create_path_data(values, spans, window, h, knots)
         return Element(
             parent,
             "path",
@@ -89,13 +139,15 @@ class Sparkline:
             style="mix-blend-mode: var(--blend-mode);",
         )
 
-    def render(self, parent: ET.Element, spans: list[TokenBB], window: slice, x=0.0, y=0.0, h=20.0):
+    def render(self, parent: ET.Element, spans: Sequence[TokenBB] | TokenBBArray, window: slice, x=0.0, y=0.0, h=20.0):
         """Render all series into the plot at the specified position."""
         # Create transform group if needed
         if x != 0.0 or y != 0.0:
             parent = Element(parent, "g", transform=f"translate({x}, {y})")
 
-        w = sum(span.width for span in spans[window])
+        knots = self._knots(spans, window)
+        # x is relative to the window start, so the window's end position is its width
+        w = float(knots.x[knots.inner.stop])
 
         clip = Element(parent, "clipPath", id=f"clip-{next(id_sequence)}")
         Element(clip, "rect", x=0, y=-h, width=w, height=h * 2)
@@ -110,23 +162,20 @@ class Sparkline:
                 h=h,
                 color=series.color,
                 dasharray=series.dasharray,
+                knots=knots,
             )
             path.set("clip-path", f"url(#{clip.get('id')})")
 
-        # Render token baseline, so it's clear where each one starts and ends
-        segments = []
-        x = 0.0
-        for span in spans[window]:
-            segments.append((x + span.first_char, x + span.last_char))
-            x += span.width
-
+        # Render token baseline, so it's clear where each one starts and ends.
+        # Pad each segment by dx as whole arrays, and format the constant y once.
         dx = 0.2
+        x1 = (knots.vertex1[knots.inner] - dx).tolist()
+        x2 = (knots.vertex2[knots.inner] + dx).tolist()
+        yh = f"{h:.1f}"
         Element(
             parent,
             "path",
-            d=" ".join(
-                f"M{first_char - dx:.1f},{h:.1f} L{last_char + dx:.1f},{h:.1f}" for first_char, last_char in segments
-            ),
+            d=" ".join([f"M{a:.1f},{yh} L{b:.1f},{yh}" for a, b in zip(x1, x2, strict=True)]),
             fill="none",
             stroke="var(--col-baseline)",
             stroke_width=self.baseline_width,
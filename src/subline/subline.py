@@ -4,7 +4,7 @@ from typing import Sequence
 
 from subline.series import Series
 from subline.sparkline import Sparkline
-from subline.types import TokenBB
+from subline.types import TokenBB, TokenBBArray
 from utils.dom import Element
 
 
@@ -199,13 +199,14 @@ class Subline:
             )
 
         text_width = self.chars_per_line * self.char_width
+        packed = TokenBBArray.of(spans)  # once for all lines, rather than per render
         for i, window in enumerate(lines):
             y_offset = i * full_line_height + self.margin
             baseline = y_offset + self.font_size + 1
             self._add_text_line(svg, tokens, window, self.margin, baseline)
             sparkline.render(
                 parent=svg,
-                spans=spans,
+                spans=packed,
                 window=window,
                 x=self.margin,
                 y=baseline + 1,
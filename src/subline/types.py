@@ -1,8 +1,14 @@
 from dataclasses import dataclass
 from math import isclose
+from typing import Sequence
 
+import numpy as np
 
-@dataclass
+# A token is wide when its first and last chars aren't (relatively) the same point
+_WIDE_REL_TOL = 0.05
+
+
+@dataclass(slots=True)
 class TokenBB:
     """
     1D bounding box for a token.
@@ -24,4 +30,56 @@ class TokenBB:
 
     @property
     def is_wide(self):
-        return not isclose(self.first_char, self.last_char, rel_tol=0.05)
+        return not isclose(self.first_char, self.last_char, rel_tol=_WIDE_REL_TOL)
+
+
+class TokenBBArray:
+    """
+    Struct-of-arrays counterpart to a sequence of `TokenBB`.
+
+    Backed by one ``(n, 4)`` float64 buffer, so rendering code can slice whole
+    columns instead of reading attributes token by token. Slicing returns a view.
+    """
+
+    WIDTH, FIRST, MID, LAST = range(4)
+
+    def __init__(self, data: np.ndarray):
+        self.data = data
+
+    @classmethod
+    def of(cls, spans: Sequence[TokenBB] | TokenBBArray) -> TokenBBArray:
+        """Pack *spans* into an array, or return it as-is if it already is one."""
+        if isinstance(spans, TokenBBArray):
+            return spans
+        data = np.array([(s.width, s.first_char, s.mid, s.last_char) for s in spans], dtype=np.float64)
+        return cls(data.reshape(-1, 4))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, window: slice) -> TokenBBArray:
+        return TokenBBArray(self.data[window])
+
+    @property
+    def widths(self) -> np.ndarray:
+        return self.data[:, self.WIDTH]
+
+    @property
+    def first_chars(self) -> np.ndarray:
+        return self.data[:, self.FIRST]
+
+    @property
+    def mids(self) -> np.ndarray:
+        return self.data[:, self.MID]
+
+    @property
+    def last_chars(self) -> np.ndarray:
+        return self.data[:, self.LAST]
+
+    @property
+    def is_wide(self) -> np.ndarray:
+        # Same symmetric test as math.isclose (not np.isclose, which is asymmetric
+        # and has an absolute tolerance), so this agrees with TokenBB.is_wide.
+        first, last = self.first_chars, self.last_chars
+        diff = np.abs(last - first)
+        return ~((diff <= np.abs(_WIDE_REL_TOL * last)) | (diff <= np.abs(_WIDE_REL_TOL * first)))
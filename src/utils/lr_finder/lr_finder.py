@@ -1,3 +1,5 @@
+from itertools import pairwise
+import math
 from typing import Callable, Iterator, TypeAlias, cast
 
 import equinox as eqx
@@ -126,13 +128,14 @@ def lr_finder_search(
 @validate_call
 def _calculate_zoom_range(proposed_range: Range, current_range: Range, zoom_factor: float) -> Range:
     """Calculate the next learning rate range in log space."""
-    log_start, log_end = np.log(current_range)
-    log_low, log_high = np.log(proposed_range)
+    # Scalar math: NumPy's per-call dispatch costs more than the arithmetic on two values
+    log_start, log_end = math.log(current_range[0]), math.log(current_range[1])
+    log_low, log_high = math.log(proposed_range[0]), math.log(proposed_range[1])
 
     new_log_start = log_start + (1 - zoom_factor) * (log_low - log_start)
     new_log_end = log_end - (1 - zoom_factor) * (log_end - log_high)
 
-    return np.exp(new_log_start), np.exp(new_log_end)
+    return math.exp(new_log_start), math.exp(new_log_end)
 
 
 @validate_call
@@ -145,19 +148,22 @@ def _get_lr_schedule(range: Range, n_steps: int) -> np.ndarray:
 @validate_call
 def _find_steepest(lrs: list[float], losses: list[float]) -> float:
     """Find best learning rate using gradient-weighted average."""
-    lrs_array = np.array(lrs)
-    losses_array = np.array(losses)
-
-    gradients = losses_array[1:] - losses_array[:-1]
-    weights = np.maximum(0, -(gradients - gradients.max()))
-
-    if weights.sum() > 0:
-        mid_points = np.exp((np.log(lrs_array[1:]) + np.log(lrs_array[:-1])) / 2)
-        best_lr = np.exp(np.average(np.log(mid_points), weights=weights))
-    else:
-        best_lr = np.exp((np.log(lrs_array[0]) + np.log(lrs_array[-1])) / 2)
-
-    return best_lr
+    # One scalar pass instead of a NumPy pipeline: these curves have one point per
+    # step, so per-op dispatch and temporaries cost more than the arithmetic.
+    log_lrs = [math.log(lr) for lr in lrs]
+    gradients = [b - a for a, b in pairwise(losses)]
+    max_gradient = max(gradients)
+
+    weight_sum = 0.0
+    weighted_log_sum = 0.0
+    for i, gradient in enumerate(gradients):
+        weight = max_gradient - gradient  # steeper descent weighs more; never negative
+        weight_sum += weight
+        weighted_log_sum += weight * (log_lrs[i] + log_lrs[i + 1]) / 2  # log of the geometric midpoint
+
+    if weight_sum > 0:
+        return math.exp(weighted_log_sum / weight_sum)
+    return math.exp((log_lrs[0] + log_lrs[-1]) / 2)
 
 
 @validate_call
@@ -1,5 +1,6 @@
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import LineCollection, PolyCollection
 from matplotlib.colors import Normalize
 from matplotlib.figure import Figure
 
@@ -19,20 +20,23 @@ def plot_lr_finder(
     ax.set_ylabel("Loss")
     ax.set_xscale("log")
 
+    # One color per zoom level, looked up by index rather than re-evaluating the colormap per curve
     cmap = plt.get_cmap("viridis")
-    norm = Normalize(0, config.num_zooms)
+    colors = cmap(Normalize(0, config.num_zooms)(np.arange(config.num_zooms + 1)))
 
-    # Fill between consecutive zoom curves
-    for h1, h2 in zip(history[1:], history[:-1], strict=True):
-        color = cmap(norm(h1.zoom))
-        xs = np.concatenate([h1.lrs, h2.lrs[::-1]])
-        ys = np.concatenate([h1.losses, h2.losses[::-1]])
-        ax.fill(xs, ys, color=color, alpha=0.3)
-        ax.semilogx(h1.lrs, h1.losses, color=color, linewidth=1)
+    # Fill between consecutive zoom curves: each polygon is one curve followed by the
+    # previous one reversed. All fills and all curves go in as one artist apiece.
+    if len(history) > 1:
+        curves = [np.column_stack([h.lrs, h.losses]) for h in history]
+        verts = [np.concatenate([c1, c2[::-1]]) for c1, c2 in zip(curves[1:], curves[:-1], strict=True)]
+        pair_colors = colors[[h.zoom for h in history[1:]]]
+        ax.add_collection(PolyCollection(verts, facecolors=pair_colors, edgecolors=pair_colors, alpha=0.3))
+        ax.add_collection(LineCollection(curves[1:], colors=pair_colors, linewidths=1, capstyle="projecting"))
+        ax.autoscale_view()
 
     # Final zoom scale
     series = history[-1]
-    color = cmap(norm(series.zoom))
+    color = colors[series.zoom]
     ax.semilogx(series.lrs, series.losses, color=color, linewidth=1)
     ax.axvline(
         x=series.best_lr,
@@ -42,12 +46,8 @@ def plot_lr_finder(
     )
 
     # Steepest-gradient progression across zooms
-    best_lrs = []
-    best_losses = []
-    for s in history:
-        loss = np.exp(np.interp(np.log(s.steepest_lr), np.log(s.lrs), np.log(s.losses)))
-        best_lrs.append(s.steepest_lr)
-        best_losses.append(loss)
+    best_lrs = [s.steepest_lr for s in history]
+    best_losses = np.exp([np.interp(np.log(s.steepest_lr), np.log(s.lrs), np.log(s.losses)) for s in history])
 
     ax.semilogx(
         best_lrs,
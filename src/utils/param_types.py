@@ -22,7 +22,13 @@ IntX32 = Annotated[int, Gt(0), MultipleOf(32)]
 IntX64 = Annotated[int, Gt(0), MultipleOf(64)]
 """Multiple of 64"""
 
-PowerOf2 = Annotated[int, Gt(0), Predicate(lambda v: (v & (v - 1)) == 0)]
+
+def _is_power_of_2(v: int) -> bool:
+    # Single popcount; Gt(0) runs first, so negatives never get here
+    return v.bit_count() == 1
+
+
+PowerOf2 = Annotated[int, Gt(0), Predicate(_is_power_of_2)]
 """Power of 2"""
 
 AnyCallableT = TypeVar("AnyCallableT", bound=Callable[..., Any])
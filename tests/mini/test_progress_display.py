@@ -99,3 +99,17 @@ def test_rich_progress_display_routes_logging_while_running():
         root.setLevel(saved_level)
 
     assert "mid-run-log" in buf.getvalue()
+
+
+def test_unchanged_update_is_skipped():
+    """A message that changes nothing visible (a metrics-only re-emit) doesn't count the job done twice."""
+    queue: LocalQueue[ProgressMessage] = LocalQueue()
+    display = RichProgressDisplay(total_jobs=2, queue=queue)
+    display.console = Console(file=io.StringIO(), force_terminal=False)
+    queue.put(ProgressMessage(run_id="r", job_id="0", step=3, total=3))
+    queue.put(ProgressMessage(run_id="r", job_id="0", step=3, total=3, metrics={"loss": 0.1}))
+    queue.put(EndOfQueue())
+    with display:
+        pass
+
+    assert display._completed == 1
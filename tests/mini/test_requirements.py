@@ -0,0 +1,28 @@
+import textwrap
+
+from mini.requirements import parse_uv_tree_output
+
+UV_TREE = textwrap.dedent("""
+    mi-ni v0.1.0
+    ├── modal v1.0.3
+    │   └── aiohappyeyeballs[speedups] v2.6.1
+    ├── torch v2.7.0+cpu (extra: cpu)
+    ├── numpy v2.1.0 (extra: foo v3.0)
+    └── modal v1.0.3 (*)
+""")
+
+
+def test_parse_uv_tree_output():
+    """Each line yields its first package, with extras kept and local versions stripped."""
+    assert parse_uv_tree_output(UV_TREE, ignore_first=True) == [
+        "aiohappyeyeballs[speedups]==2.6.1",
+        "modal==1.0.3",
+        "numpy==2.1.0",
+        "torch==2.7.0",
+    ]
+
+
+def test_parse_uv_tree_output_keeps_first_line():
+    """Without `ignore_first`, the root project is parsed too."""
+    assert "mi-ni==0.1.0" in parse_uv_tree_output(UV_TREE, ignore_first=False)
+    assert "mi-ni==0.1.0" not in parse_uv_tree_output(UV_TREE, ignore_first=True)
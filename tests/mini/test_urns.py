@@ -1,4 +1,6 @@
-from mini.urns import matches_urn
+import urllib.parse
+
+from mini.urns import matches_urn, parse_urn, to_urn
 
 
 def test_matches_exact():
@@ -52,3 +54,18 @@ def test_matches_complex_patterns():
     assert matches_urn(complex_urn, "mini:*:database:*:profile:*:*")
     assert not matches_urn(complex_urn, "mini:system:database:*:settings:*")
     assert matches_urn(complex_urn, "mini:system:database:*:*:*")
+
+
+def test_to_urn_escapes_like_urllib():
+    """Parts are percent-encoded exactly as ``urllib.parse.quote(safe="")`` would."""
+    parts = ["mini", "", "a_b.c-d~9", "hello world", "epoch 3/10: loss=0.25%", "héllo wörld", "日本"]
+    assert to_urn(*parts) == ":".join(urllib.parse.quote(part, safe="") for part in parts)
+    assert parse_urn(to_urn(*parts)) == tuple(parts)
+
+
+def test_matches_shorter_urn_and_escaped_wildcard():
+    """Trailing wildcards may run past the URN's end; an escaped '*' is matched literally."""
+    assert matches_urn("mini:test", "mini:test:*")
+    assert not matches_urn("mini:test", "mini:test:123")
+    assert matches_urn("mini:%2A", "mini:%2A")
+    assert not matches_urn("mini:x", "mini:%2A")
@@ -4,7 +4,9 @@ import numpy as np
 import pytest
 
 from subline.series import Series
+from subline.sparkline import Sparkline
 from subline.subline import Subline
+from subline.types import TokenBB, TokenBBArray
 
 
 def _series(n: int) -> Series:
@@ -43,3 +45,29 @@ def test_default_css_is_neutral():
     """Absent a `css` override, the library keeps its own neutral dark background."""
     svg = Subline().plot("hi", [_series(2)])
     assert "light-dark(#fff, #2a2a2a)" in svg
+
+
+@pytest.mark.parametrize(
+    "window, expected",
+    [
+        (slice(0, 3), "M 2.0,10.0 S 6.0,10.0 8.0,10.0 M 16.0,15.0 S 20.0,15.0 22.0,15.0"),
+        # A leading peek token is drawn one width to the left of the window
+        (slice(1, 3), "M -8.0,10.0 S -4.0,10.0 -2.0,10.0 M 6.0,15.0 S 10.0,15.0 12.0,15.0"),
+    ],
+)
+def test_sparkline_path_breaks_at_nan(window, expected):
+    """NaN values split the path into subpaths; wide tokens get a second knot at their last char."""
+    spans = [TokenBB(10, 2, 5, 8), TokenBB(4, 2, 2, 2), TokenBB(10, 2, 5, 8)]
+    values = np.array([0.5, np.nan, 0.25])
+    assert Sparkline()._create_path_data(values, spans, window, h=20.0) == expected
+
+
+def test_token_array_matches_scalar_spans():
+    """The packed array agrees with per-token `TokenBB` fields, including `is_wide` at its tolerance edges."""
+    bounds = [(8.4, 4.2, 4.2), (0, 0, 0), (10, 1, 1.05), (10, 1, 1.06), (9, 2, 7)]
+    spans = [TokenBB(width, first, (first + last) / 2, last) for width, first, last in bounds]
+    packed = TokenBBArray.of(spans)
+    assert packed.widths.tolist() == [s.width for s in spans]
+    assert packed.is_wide.tolist() == [s.is_wide for s in spans] == [False, False, False, True, True]
+    assert packed[1:3].last_chars.tolist() == [0, 1.05]
+    assert TokenBBArray.of(packed) is packed
@@ -0,0 +1,19 @@
+import pytest
+
+from utils.lr_finder.lr_finder import _find_steepest
+
+
+def test_find_steepest_weights_midpoints_by_descent():
+    """Steeper drops pull the estimate toward their interval's geometric midpoint."""
+    # Gradients are [-0.2, -0.6, +0.1], so the weights are [0.3, 0.7, 0] and the result
+    # is 10 ** (0.3 * -3.5 + 0.7 * -2.5).
+    lrs = [1e-4, 1e-3, 1e-2, 1e-1]
+    losses = [1.0, 0.8, 0.2, 0.3]
+    assert _find_steepest(lrs, losses) == pytest.approx(10**-2.8)
+
+
+def test_find_steepest_falls_back_to_geometric_center():
+    """With equal gradients every weight is zero, so the middle of the range (in log space) is used."""
+    lrs = [1e-6, 1e-4, 1e-2]
+    losses = [3.0, 2.0, 1.0]
+    assert _find_steepest(lrs, losses) == pytest.approx(1e-4)